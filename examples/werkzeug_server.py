@@ -10,7 +10,7 @@ def ping() -> Result:
 
 @Request.application
 def application(request):
-    return Response(dispatch(request.data.decode()), 200, mimetype="application/json")
+    return Response(dispatch(request.data), 200, mimetype="application/json")
 
 
 if __name__ == "__main__":
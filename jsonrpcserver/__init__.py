@@ -15,14 +15,35 @@ __all__ = [
     "serve",
 ]
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .async_main import (
-    dispatch as async_dispatch,
-    dispatch_to_response as async_dispatch_to_response,
-    dispatch_to_serializable as async_dispatch_to_serializable,
-)
 from .exceptions import JsonRpcError
 from .main import dispatch, dispatch_to_response, dispatch_to_serializable
 from .methods import method
 from .result import Error, InvalidParams, Result, Success
-from .server import serve as serve
+
+if TYPE_CHECKING:
+    from .async_main import (
+        dispatch as async_dispatch,
+        dispatch_to_response as async_dispatch_to_response,
+        dispatch_to_serializable as async_dispatch_to_serializable,
+    )
+    from .server import serve as serve
+
+# These are imported on first use (PEP 562), so that users of the sync functions
+# don't pay for importing asyncio and http.server. Maps name -> (module, attribute).
+LAZY_IMPORTS = {
+    "async_dispatch": ("async_main", "dispatch"),
+    "async_dispatch_to_response": ("async_main", "dispatch_to_response"),
+    "async_dispatch_to_serializable": ("async_main", "dispatch_to_serializable"),
+    "serve": ("server", "serve"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attribute = LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(import_module(f".{module}", __name__), attribute)
@@ -2,11 +2,11 @@
 
 from functools import partial
 from itertools import starmap
-from typing import Any, Callable, Iterable, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union, cast
 import asyncio
 import logging
 
-from oslash.either import Left  # type: ignore
+from .either import Left
 
 from .dispatcher import (
     Deserialized,
@@ -23,17 +23,18 @@ from .dispatcher import (
     validate_result,
 )
 from .exceptions import JsonRpcError
-from .methods import Method, Methods
+from .methods import Method, Methods, method_attribute
 from .request import Request
 from .result import Result, InternalErrorResult, ErrorResult
 from .response import Response, ServerErrorResponse
-from .utils import make_list
+from .sentinels import NOID
 
 
 async def call(request: Request, context: Any, method: Method) -> Result:
     try:
-        result = await method(
-            *extract_args(request, context), **extract_kwargs(request)
+        result = await cast(
+            Awaitable[Result],
+            method(*extract_args(request, context), **extract_kwargs(request)),
         )
         validate_result(result)
     except JsonRpcError as exc:
@@ -44,8 +45,31 @@ async def call(request: Request, context: Any, method: Method) -> Result:
     return result
 
 
+# Calls shared between identical requests in a batch, keyed by method name and params.
+SharedCalls = Dict[Tuple[str, str], "asyncio.Future[Result]"]
+
+
+def shared_call(
+    calls: SharedCalls, request: Request, context: Any, method: Method
+) -> Awaitable[Result]:
+    """Call the method, unless it's memoized (@method(memoize=True)) and an identical
+    request in the same batch has already called it, in which case that call is shared.
+
+    The params come from deserialized json, so their repr is a reliable key.
+    """
+    if not method_attribute(method, "__jsonrpc_memoize__"):
+        return call(request, context, method)
+    key = (request.method, repr(request.params))
+    if key not in calls:
+        calls[key] = asyncio.ensure_future(call(request, context, method))
+    return calls[key]
+
+
 async def dispatch_request(
-    methods: Methods, context: Any, request: Request
+    methods: Methods,
+    context: Any,
+    request: Request,
+    calls: Optional[SharedCalls] = None,
 ) -> Tuple[Request, Result]:
     method = get_method(methods, request.method).bind(
         partial(validate_args, request, context)
@@ -54,24 +78,36 @@ async def dispatch_request(
         request,
         method
         if isinstance(method, Left)
-        else await call(request, context, method._value),
+        else await (
+            call(request, context, method._value)
+            if calls is None
+            else shared_call(calls, request, context, method._value)
+        ),
     )
 
 
 async def dispatch_deserialized(
     methods: Methods,
     context: Any,
-    post_process: Callable[[Response], Iterable[Any]],
+    post_process: Callable[[Response], Any],
     deserialized: Deserialized,
-) -> Union[Response, Iterable[Response], None]:
+) -> Any:
+    if not isinstance(deserialized, list):
+        request, result = await dispatch_request(
+            methods, context, create_request(deserialized)
+        )
+        return (
+            None if request.id is NOID else post_process(to_response(request, result))
+        )
+    calls: SharedCalls = {}
     results = await asyncio.gather(
         *(
-            dispatch_request(methods, context, r)
-            for r in map(create_request, make_list(deserialized))
+            dispatch_request(methods, context, r, calls)
+            for r in map(create_request, deserialized)
         )
     )
     return extract_list(
-        isinstance(deserialized, list),
+        True,
         map(
             post_process,
             starmap(to_response, filter(not_notification, results)),
@@ -81,13 +117,13 @@ async def dispatch_deserialized(
 
 async def dispatch_to_response_pure(
     *,
-    deserializer: Callable[[str], Deserialized],
+    deserializer: Callable[[Union[str, bytes]], Deserialized],
     validator: Callable[[Deserialized], Deserialized],
     methods: Methods,
     context: Any,
-    post_process: Callable[[Response], Iterable[Any]],
-    request: str,
-) -> Union[Response, Iterable[Response], None]:
+    post_process: Callable[[Response], Any],
+    request: Union[str, bytes],
+) -> Any:
     try:
         result = deserialize_request(deserializer, request).bind(
             partial(validate_request, validator)
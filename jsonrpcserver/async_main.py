@@ -1,10 +1,9 @@
 """Async version of main.py. The public async functions."""
-import json
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union, cast
 
 from .async_dispatcher import dispatch_to_response_pure
 from .dispatcher import Deserialized
-from .main import default_validator, default_deserializer
+from .main import default_deserializer, default_serializer, default_validator
 from .methods import Methods, global_methods
 from .response import Response, to_serializable
 from .sentinels import NOCONTEXT
@@ -12,21 +11,24 @@ from .utils import identity
 
 
 async def dispatch_to_response(
-    request: str,
+    request: Union[str, bytes],
     methods: Optional[Methods] = None,
     *,
     context: Any = NOCONTEXT,
-    deserializer: Callable[[str], Deserialized] = default_deserializer,
+    deserializer: Callable[[Union[str, bytes]], Deserialized] = default_deserializer,
     validator: Callable[[Deserialized], Deserialized] = default_validator,
     post_process: Callable[[Response], Any] = identity,
 ) -> Union[Response, Iterable[Response], None]:
-    return await dispatch_to_response_pure(
-        deserializer=deserializer,
-        validator=validator,
-        post_process=post_process,
-        context=context,
-        methods=global_methods if methods is None else methods,
-        request=request,
+    return cast(
+        Union[Response, Iterable[Response], None],
+        await dispatch_to_response_pure(
+            deserializer=deserializer,
+            validator=validator,
+            post_process=post_process,
+            context=context,
+            methods=global_methods if methods is None else methods,
+            request=request,
+        ),
     )
 
 
@@ -43,7 +45,7 @@ async def dispatch_to_json(
     *args: Any,
     serializer: Callable[
         [Union[Dict[str, Any], List[Dict[str, Any]], None]], str
-    ] = json.dumps,
+    ] = default_serializer,
     **kwargs: Any,
 ) -> str:
     response = await dispatch_to_serializable(*args, **kwargs)
@@ -6,3 +6,12 @@ ERROR_METHOD_NOT_FOUND = -32601
 ERROR_INVALID_PARAMS = -32602
 ERROR_INTERNAL_ERROR = -32603
 ERROR_SERVER_ERROR = -32000
+
+# The messages that go with the error codes above. Defined once here so the error
+# results and responses can't drift apart.
+MSG_PARSE_ERROR = "Parse error"
+MSG_INVALID_REQUEST = "Invalid request"
+MSG_METHOD_NOT_FOUND = "Method not found"
+MSG_INVALID_PARAMS = "Invalid params"
+MSG_INTERNAL_ERROR = "Internal error"
+MSG_SERVER_ERROR = "Server error"
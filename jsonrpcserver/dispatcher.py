@@ -1,16 +1,27 @@
 """Dispatcher - does the hard work of this library: parses, validates and dispatches
 requests, providing responses.
 """
-from functools import partial
-from inspect import signature
+from functools import lru_cache, partial
+from inspect import Signature, signature
 from itertools import starmap
-from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+    cast,
+)
 import logging
+import os
 
-from oslash.either import Either, Left, Right  # type: ignore
+from .either import Either, Left, Right
 
 from .exceptions import JsonRpcError
-from .methods import Method, Methods
+from .methods import Method, Methods, method_attribute
 from .request import Request
 from .response import (
     ErrorResponse,
@@ -29,21 +40,52 @@ from .result import (
     SuccessResult,
 )
 from .sentinels import NOCONTEXT, NOID
-from .utils import compose, make_list
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
 
 Deserialized = Union[Dict[str, Any], List[Dict[str, Any]]]
 
 
-def extract_list(
-    is_batch: bool, responses: Iterable[Response]
-) -> Union[Response, List[Response], None]:
+def workers_from_env() -> int:
+    """Read the number of threads to dispatch batch requests on from JSONRPC_WORKERS.
+
+    An invalid value is logged and ignored, rather than stopping the package from
+    being imported.
+    """
+    value = os.getenv("JSONRPC_WORKERS", "0")
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logging.warning("Ignoring invalid JSONRPC_WORKERS value %r", value)
+        return 0
+
+
+# Number of threads to dispatch batch requests on. Zero (the default) dispatches them
+# one after the other in the calling thread.
+WORKERS = workers_from_env()
+
+
+@lru_cache(maxsize=None)
+def thread_pool() -> "ThreadPoolExecutor":
+    """The thread pool used to dispatch batch requests, created on first use.
+
+    concurrent.futures is imported here, so it isn't imported at all unless threads
+    are enabled.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=WORKERS)
+
+
+def extract_list(is_batch: bool, responses: Iterable[Any]) -> Any:
     """This is the inverse of make_list. Here we extract a response back out of the list
     if it wasn't a batch request originally. Also applies a JSON-RPC rule: we do not
     respond to batches of notifications.
 
     Args:
         is_batch: True if the original request was a batch.
-        responses: Iterable of responses.
+        responses: Iterable of responses (with post_process applied).
 
     Returns: A single response, a batch of responses, or None (returns None to a
         notification or batch of notifications, to indicate we should not respond).
@@ -102,7 +144,7 @@ def extract_kwargs(request: Request) -> Dict[str, Any]:
     return request.params if isinstance(request.params, dict) else {}
 
 
-def validate_result(result: Result) -> None:
+def validate_result(result: Any) -> None:
     """Validate the return value from a method.
 
     Raises an AssertionError if the result returned from a method is invalid.
@@ -122,7 +164,10 @@ def call(request: Request, context: Any, method: Method) -> Result:
     Returns: A Result.
     """
     try:
-        result = method(*extract_args(request, context), **extract_kwargs(request))
+        # The method may not return a Result, so don't assume it does until validated.
+        result = cast(Callable[..., Any], method)(
+            *extract_args(request, context), **extract_kwargs(request)
+        )
         # validate_result raises AssertionError if the return value is not a valid
         # Result, which should respond with Internal Error because its a problem in the
         # method.
@@ -135,7 +180,24 @@ def call(request: Request, context: Any, method: Method) -> Result:
     except Exception as exc:
         logging.exception(exc)
         return Left(InternalErrorResult(str(exc)))
-    return result
+    return cast(Result, result)
+
+
+cached_signature = lru_cache(maxsize=512)(signature)
+
+
+def get_signature(func: Method) -> Signature:
+    """Get the signature of a method.
+
+    inspect.signature is slow, and the same methods are called over and over, so the
+    signatures are cached. Callables that can't be hashed aren't cached.
+
+    Returns: The method's Signature.
+    """
+    try:
+        return cached_signature(func)
+    except TypeError:
+        return signature(func)
 
 
 def validate_args(
@@ -145,8 +207,20 @@ def validate_args(
 
     Returns: Either the function to be called, or an Invalid Params error result.
     """
+    args, kwargs = extract_args(request, context), extract_kwargs(request)
+    # Methods added with @method have their arity worked out in advance, so positional
+    # arguments can be checked quickly. Anything else is bound to the signature, which
+    # also gives the error message.
+    arity = method_attribute(func, "__jsonrpc_arity__")
+    if (
+        arity is not None
+        and not kwargs
+        and arity[0] <= len(args)
+        and (arity[1] is None or len(args) <= arity[1])
+    ):
+        return Right(func)
     try:
-        signature(func).bind(*extract_args(request, context), **extract_kwargs(request))
+        get_signature(func).bind(*args, **kwargs)
     except TypeError as exc:
         return Left(InvalidParamsResult(str(exc)))
     return Right(func)
@@ -157,6 +231,7 @@ def get_method(methods: Methods, method_name: str) -> Either[ErrorResult, Method
 
     Returns: Either the function to be called, or a Method Not Found result.
     """
+    # Subscript rather than methods.get, so dict subclasses with __missing__ work.
     try:
         return Right(methods[method_name])
     except KeyError:
@@ -198,9 +273,9 @@ def not_notification(request_result: Any) -> bool:
 def dispatch_deserialized(
     methods: Methods,
     context: Any,
-    post_process: Callable[[Response], Iterable[Any]],
+    post_process: Callable[[Response], Any],
     deserialized: Deserialized,
-) -> Union[Response, List[Response], None]:
+) -> Any:
     """This is simply continuing the pipeline from dispatch_to_response_pure. It exists
     only to be an abstraction, otherwise that function is doing too much. It continues
     on from the request string having been parsed and validated.
@@ -208,12 +283,24 @@ def dispatch_deserialized(
     Returns: A Response, a list of Responses, or None. If post_process is passed, it's
         applied to the Response(s).
     """
-    results = map(
-        compose(partial(dispatch_request, methods, context), create_request),
-        make_list(deserialized),
+    # Single requests are the common case, so skip the batch machinery for those.
+    if not isinstance(deserialized, list):
+        request, result = dispatch_request(
+            methods, context, create_request(deserialized)
+        )
+        return (
+            None if request.id is NOID else post_process(to_response(request, result))
+        )
+    # A single lazy pass over the requests - each one is created and dispatched before
+    # moving on to the next, without building any intermediate lists. If threads are
+    # enabled, the requests are dispatched concurrently instead (results still come
+    # back in order).
+    results = (thread_pool().map if WORKERS > 0 and len(deserialized) > 1 else map)(
+        partial(dispatch_request, methods, context),
+        map(create_request, deserialized),
     )
     responses = starmap(to_response, filter(not_notification, results))
-    return extract_list(isinstance(deserialized, list), map(post_process, responses))
+    return extract_list(True, map(post_process, responses))
 
 
 def validate_request(
@@ -236,7 +323,8 @@ def validate_request(
 
 
 def deserialize_request(
-    deserializer: Callable[[str], Deserialized], request: str
+    deserializer: Callable[[Union[str, bytes]], Deserialized],
+    request: Union[str, bytes],
 ) -> Either[ErrorResponse, Deserialized]:
     """Parse the JSON request string.
 
@@ -244,6 +332,10 @@ def deserialize_request(
     """
     try:
         return Right(deserializer(request))
+    # A missing optional dependency (such as orjson) isn't a problem with the request,
+    # so don't hide it in a parse error response.
+    except ImportError:
+        raise
     # Since the deserializer is unknown, the specific exception that will be raised is
     # also unknown. Any exception raised we assume the request is invalid, return a
     # parse error response.
@@ -253,13 +345,13 @@ def deserialize_request(
 
 def dispatch_to_response_pure(
     *,
-    deserializer: Callable[[str], Deserialized],
+    deserializer: Callable[[Union[str, bytes]], Deserialized],
     validator: Callable[[Deserialized], Deserialized],
     methods: Methods,
     context: Any,
-    post_process: Callable[[Response], Iterable[Any]],
-    request: str,
-) -> Union[Response, List[Response], None]:
+    post_process: Callable[[Response], Any],
+    request: Union[str, bytes],
+) -> Any:
     """A function from JSON-RPC request string to Response namedtuple(s), (yet to be
     serialized to json).
 
@@ -0,0 +1,50 @@
+"""A minimal Either type, holding either an error (Left) or a value (Right).
+
+This is all the library needs from an Either - the two cases, equality and bind. It
+replaces oslash's Either, which is much heavier for something constructed on every
+request.
+"""
+from typing import Any, Callable, Generic, TypeVar, Union
+
+L = TypeVar("L")
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+class Left(Generic[L]):
+    """The error case."""
+
+    __slots__ = ("_error",)
+
+    def __init__(self, error: L) -> None:
+        self._error = error
+
+    def bind(self, func: Callable[[Any], T]) -> "Left[L]":
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Left) and self._error == other._error
+
+    def __repr__(self) -> str:
+        return f"Left({self._error!r})"
+
+
+class Right(Generic[R]):
+    """The success case."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: R) -> None:
+        self._value = value
+
+    def bind(self, func: Callable[[R], T]) -> T:
+        return func(self._value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Right) and self._value == other._value
+
+    def __repr__(self) -> str:
+        return f"Right({self._value!r})"
+
+
+Either = Union[Left[L], Right[R]]
@@ -0,0 +1,109 @@
+"""An opt-in fast path using msgspec (pip install jsonrpcserver[msgspec]).
+
+msgspec parses the request bytes directly into typed structs, validating them against
+the JSON-RPC request format in the same pass, so there's no intermediate dict and no
+separate schema validation. Responses are encoded with msgspec too.
+
+    >>> from jsonrpcserver.fast import fast_dispatch
+    >>> fast_dispatch(b'{"jsonrpc": "2.0", "method": "ping", "id": 1}')
+    b'{"jsonrpc":"2.0","result":"pong","id":1}'
+
+Unlike dispatch, the response is bytes, and nan and inf results are serialized as null.
+"""
+from functools import partial
+from itertools import starmap
+from typing import Any, Dict, List, Literal, Optional, Union
+import logging
+
+import msgspec
+
+from .dispatcher import dispatch_request, extract_list, not_notification, to_response
+from .either import Left
+from .methods import Methods, global_methods
+from .request import Request
+from .response import (
+    InvalidRequestResponse,
+    ParseErrorResponse,
+    ServerErrorResponse,
+    to_serializable_one,
+)
+from .sentinels import NOCONTEXT, NOID
+from .utils import make_list
+
+
+class RequestModel(msgspec.Struct, forbid_unknown_fields=True):
+    """A JSON-RPC request object, equivalent to the request schema."""
+
+    jsonrpc: Literal["2.0"]
+    method: str
+    params: Union[List[Any], Dict[str, Any]] = []
+    id: Union[int, float, str, None, msgspec.UnsetType] = msgspec.UNSET
+
+
+decoder = msgspec.json.Decoder(Union[List[RequestModel], RequestModel])
+encoder = msgspec.json.Encoder()
+
+
+def create_request(model: RequestModel) -> Request:
+    return Request(
+        model.method, model.params, NOID if model.id is msgspec.UNSET else model.id
+    )
+
+
+def dispatch_to_serializable(
+    request: Union[str, bytes], methods: Methods, context: Any
+) -> Any:
+    """Parse and validate the request, dispatch it, and give the response(s) as dicts
+    (or None for notifications).
+    """
+    try:
+        deserialized = decoder.decode(request)
+    # ValidationError is a subclass of DecodeError, so must come first.
+    except msgspec.ValidationError:
+        deserialized = None
+    except msgspec.DecodeError as exc:
+        return to_serializable_one(Left(ParseErrorResponse(str(exc))))
+    # Failed validation, or an empty batch.
+    if not deserialized:
+        return to_serializable_one(
+            Left(InvalidRequestResponse("The request failed schema validation"))
+        )
+    results = map(
+        partial(dispatch_request, methods, context),
+        map(create_request, make_list(deserialized)),
+    )
+    return extract_list(
+        isinstance(deserialized, list),
+        map(
+            to_serializable_one,
+            starmap(to_response, filter(not_notification, results)),
+        ),
+    )
+
+
+def fast_dispatch(
+    request: Union[str, bytes],
+    methods: Optional[Methods] = None,
+    *,
+    context: Any = NOCONTEXT,
+) -> bytes:
+    """Takes a JSON-RPC request and dispatches it to method(s), giving a JSON-RPC
+    response.
+
+    Args:
+        request: The JSON-RPC request, as str or bytes.
+        methods: Dictionary of methods that can be called. If not passed, uses the
+            internal global_methods dict which is populated with the @method decorator.
+        context: If given, will be passed as the first argument to methods.
+
+    Returns: The JSON-RPC response as bytes, or empty bytes for notifications.
+    """
+    try:
+        response = dispatch_to_serializable(
+            request, global_methods if methods is None else methods, context
+        )
+    except Exception as exc:
+        # There was an error with the jsonrpcserver library.
+        logging.exception(exc)
+        response = to_serializable_one(Left(ServerErrorResponse(str(exc), None)))
+    return b"" if response is None else encoder.encode(response)
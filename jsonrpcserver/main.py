@@ -12,7 +12,8 @@ request, but they each give a different return value.
 from typing import Any, Callable, Dict, List, Optional, Union, cast
 import json
 
-from jsonschema.validators import validator_for  # type: ignore
+from functools import lru_cache
+import importlib
 import importlib.resources
 
 from .dispatcher import dispatch_to_response_pure, Deserialized
@@ -22,22 +23,136 @@ from .sentinels import NOCONTEXT
 from .utils import identity
 
 
+@lru_cache(maxsize=None)
+def import_orjson() -> Any:
+    """Import orjson, which is optional (pip install jsonrpcserver[orjson]).
+
+    Imported this way so it type checks whether or not it's installed.
+    """
+    try:
+        return importlib.import_module("orjson")
+    except ImportError as exc:
+        raise ImportError(
+            "orjson is not installed, install it with: pip install jsonrpcserver[orjson]"
+        ) from exc
+
+
+def orjson_deserializer(request: Union[str, bytes]) -> Deserialized:
+    """Parse the request with orjson, which is several times faster than json.loads.
+
+    This is opt-in (pass deserializer=orjson_deserializer), because orjson parses
+    integers wider than 64 bits as floats, changing the params and id of requests that
+    contain them.
+
+    orjson rejects some input that json.loads accepts (such as NaN), and words its
+    error messages differently, so if it fails we fall back to json.loads, to give
+    the same Parse error message.
+    """
+    orjson = import_orjson()
+    try:
+        return cast(Deserialized, orjson.loads(request))
+    except orjson.JSONDecodeError:
+        return cast(Deserialized, json.loads(request))
+
+
+def orjson_serializer(response: Any) -> str:
+    """Serialize the response(s) with orjson, in a single call for the whole batch.
+
+    This is opt-in (pass serializer=orjson_serializer). orjson gives compact output,
+    and serializes nan and inf as null rather than NaN and Infinity.
+
+    Falls back to json.dumps for responses orjson won't serialize (such as dicts with
+    non-string keys).
+    """
+    orjson = import_orjson()
+    try:
+        return cast(bytes, orjson.dumps(response)).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(response)
+
+
 default_deserializer = json.loads
+default_serializer = json.dumps
+
+
+@lru_cache(maxsize=None)
+def request_schema() -> Dict[str, Any]:
+    """Load the JSON-RPC request schema."""
+    return cast(
+        Dict[str, Any],
+        json.loads(importlib.resources.read_text(__package__, "request-schema.json")),
+    )
+
 
-# Prepare the jsonschema validator. This is global so it loads only once, not every
-# time dispatch is called.
-schema = json.loads(importlib.resources.read_text(__package__, "request-schema.json"))
-klass = validator_for(schema)
-klass.check_schema(schema)
-default_validator = klass(schema).validate
+@lru_cache(maxsize=None)
+def schema_validator(is_batch: bool) -> Callable[[Deserialized], None]:
+    """Prepare the jsonschema validator for either a single request or a batch.
+
+    The schema accepts either one (with oneOf), but validating against the relevant
+    half directly saves jsonschema from trying both.
+
+    This is cached so each loads only once, not every time dispatch is called. They're
+    loaded on first use rather than at import, because importing jsonschema is slow
+    and well-formed requests never need it.
+    """
+    from jsonschema.validators import validator_for  # type: ignore
+
+    schema = request_schema()
+    klass = validator_for(schema)
+    klass.check_schema(schema)
+    request = schema["definitions"]["request"]
+    return cast(
+        Callable[[Deserialized], None],
+        klass(
+            {"type": "array", "items": request, "minItems": 1} if is_batch else request
+        ).validate,
+    )
+
+
+# The keys allowed in a request object.
+REQUEST_KEYS = frozenset(("jsonrpc", "method", "params", "id"))
+
+
+def is_valid_request(request: Any) -> bool:
+    """A quick structural check that a single request matches the schema.
+
+    Only answers True if the schema would accept the request. It's much faster than
+    validating against the schema, which is only needed if this check fails.
+    """
+    return (
+        type(request) is dict
+        and request.keys() <= REQUEST_KEYS
+        and request.get("jsonrpc") == "2.0"
+        and type(request.get("method")) is str
+        and ("params" not in request or type(request["params"]) in (list, dict))
+        and (
+            "id" not in request or type(request["id"]) in (str, int, float, type(None))
+        )
+    )
+
+
+def default_validator(request: Deserialized) -> Deserialized:
+    """Validate the request against the JSON-RPC request schema.
+
+    Well-formed requests (and batches of them) pass the quick structural check;
+    anything else goes through the schema, which raises an exception if the request is
+    invalid.
+    """
+    if not (
+        all(map(is_valid_request, request))
+        if isinstance(request, list) and len(request) > 0
+        else is_valid_request(request)
+    ):
+        schema_validator(isinstance(request, list))(request)
+    return request
 
 
 def dispatch_to_response(
-    request: str,
+    request: Union[str, bytes],
     methods: Optional[Methods] = None,
     *,
     context: Any = NOCONTEXT,
-    deserializer: Callable[[str], Deserialized] = json.loads,
+    deserializer: Callable[[Union[str, bytes]], Deserialized] = default_deserializer,
     validator: Callable[[Deserialized], Deserialized] = default_validator,
     post_process: Callable[[Response], Any] = identity,
 ) -> Union[Response, List[Response], None]:
@@ -48,7 +163,8 @@ def dispatch_to_response(
     default values to be nicer for end users.
 
     Args:
-        request: The JSON-RPC request string.
+        request: The JSON-RPC request, as str or bytes. If you have bytes, pass them
+            as they are rather than decoding them first.
         methods: Dictionary of methods that can be called - mapping of function names to
             functions. If not passed, uses the internal global_methods dict which is
             populated with the @method decorator.
@@ -66,13 +182,16 @@ def dispatch_to_response(
        >>> dispatch('{"jsonrpc": "2.0", "method": "ping", "id": 1}')
        '{"jsonrpc": "2.0", "result": "pong", "id": 1}'
     """
-    return dispatch_to_response_pure(
-        deserializer=deserializer,
-        validator=validator,
-        post_process=post_process,
-        context=context,
-        methods=global_methods if methods is None else methods,
-        request=request,
+    return cast(
+        Union[Response, List[Response], None],
+        dispatch_to_response_pure(
+            deserializer=deserializer,
+            validator=validator,
+            post_process=post_process,
+            context=context,
+            methods=global_methods if methods is None else methods,
+            request=request,
+        ),
     )
 
 
@@ -92,7 +211,7 @@ def dispatch_to_json(
     *args: Any,
     serializer: Callable[
         [Union[Dict[str, Any], List[Dict[str, Any]], str]], str
-    ] = json.dumps,
+    ] = default_serializer,
     **kwargs: Any,
 ) -> str:
     """Takes a JSON-RPC request string and dispatches it to method(s), giving a JSON-RPC
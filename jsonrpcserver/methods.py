@@ -11,18 +11,62 @@ Alternatively pass your own dictionary of methods to `dispatch` with the methods
 Methods can take either positional or named arguments, but not both. This is a
 limitation of JSON-RPC.
 """
-from typing import Any, Callable, Dict, Optional, cast
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, Optional, Tuple, cast
 
 from .result import Result
 
 Method = Callable[..., Result]
 Methods = Dict[str, Method]
 
-global_methods = dict()
+global_methods: Methods = dict()
+
+# (minimum, maximum) number of positional arguments. The maximum is None if unlimited.
+Arity = Tuple[int, Optional[int]]
+
+
+def positional_arity(func: Method) -> Optional[Arity]:
+    """The number of positional arguments a method can be called with.
+
+    Returns: A tuple of the minimum and maximum number of positional arguments
+        (maximum is None if the method takes *args), or None if the method can't be
+        called with positional arguments alone or its signature can't be inspected.
+    """
+    try:
+        params = signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(p.kind is Parameter.KEYWORD_ONLY and p.default is p.empty for p in params):
+        return None
+    positional = [
+        p
+        for p in params
+        if p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    return (
+        sum(p.default is p.empty for p in positional),
+        None
+        if any(p.kind is Parameter.VAR_POSITIONAL for p in params)
+        else len(positional),
+    )
+
+
+def method_attribute(func: Method, name: str) -> Any:
+    """Get an attribute that @method set on this method, or None if it wasn't set.
+
+    getattr isn't used, because it would also find the attribute on a decorated base
+    class, or on the function behind a bound method. functools.wraps also copies the
+    attributes onto wrappers. All of these take different arguments, or behave
+    differently, so the attributes are only used if @method marked this very object.
+    """
+    attributes = getattr(func, "__dict__", None)
+    if attributes is None or attributes.get("__jsonrpc_method__") is not func:
+        return None
+    return attributes.get(name)
 
 
 def method(
-    f: Optional[Method] = None, name: Optional[str] = None
+    f: Optional[Method] = None, name: Optional[str] = None, memoize: bool = False
 ) -> Callable[..., Any]:
     """A decorator to add a function into jsonrpcserver's internal global_methods dict.
     The global_methods dict will be used by default unless a methods argument is passed
@@ -33,11 +77,27 @@ def method(
         @method(name=bar)
         def foo():
             ...
+
+    Async methods can pass memoize=True, so identical requests to the method (same
+    params) in an async batch share a single call, rather than calling it for each:
+
+        @method(memoize=True)
+        async def foo():
+            ...
     """
 
     def decorator(func: Method) -> Method:
         nonlocal name
         global_methods[name or func.__name__] = func
+        # Work out the arity now, so dispatch can check positional arguments without
+        # the cost of binding them to the signature.
+        try:
+            setattr(func, "__jsonrpc_method__", func)
+            setattr(func, "__jsonrpc_arity__", positional_arity(func))
+            if memoize:
+                setattr(func, "__jsonrpc_memoize__", True)
+        except AttributeError:  # Some callables don't allow setting attributes
+            pass
         return func
 
     return decorator(f) if callable(f) else cast(Method, decorator)
@@ -4,13 +4,17 @@ https://www.jsonrpc.org/specification#response_object
 """
 from typing import Any, Dict, List, Type, NamedTuple, Union
 
-from oslash.either import Either, Left  # type: ignore
+from .either import Either, Left
 
 from .codes import (
     ERROR_INVALID_REQUEST,
     ERROR_METHOD_NOT_FOUND,
     ERROR_PARSE_ERROR,
     ERROR_SERVER_ERROR,
+    MSG_INVALID_REQUEST,
+    MSG_METHOD_NOT_FOUND,
+    MSG_PARSE_ERROR,
+    MSG_SERVER_ERROR,
 )
 from .sentinels import NODATA
 
@@ -23,7 +27,7 @@ class SuccessResponse(NamedTuple):
     easily subclass NamedTuples in Python 3.6. (I believe it can be done in 3.8.)
     """
 
-    result: str
+    result: Any
     id: Any
 
 
@@ -49,7 +53,7 @@ def ParseErrorResponse(data: Any) -> ErrorResponse:
     the id member in the Request Object.  If there was an error in detecting the id in
     the Request object (e.g. Parse error/Invalid Request), it MUST be Null."
     """
-    return ErrorResponse(ERROR_PARSE_ERROR, "Parse error", data, None)
+    return ErrorResponse(ERROR_PARSE_ERROR, MSG_PARSE_ERROR, data, None)
 
 
 def InvalidRequestResponse(data: Any) -> ErrorResponse:
@@ -58,15 +62,15 @@ def InvalidRequestResponse(data: Any) -> ErrorResponse:
     the id member in the Request Object.  If there was an error in detecting the id in
     the Request object (e.g. Parse error/Invalid Request), it MUST be Null."
     """
-    return ErrorResponse(ERROR_INVALID_REQUEST, "Invalid request", data, None)
+    return ErrorResponse(ERROR_INVALID_REQUEST, MSG_INVALID_REQUEST, data, None)
 
 
 def MethodNotFoundResponse(data: Any, id: Any) -> ErrorResponse:
-    return ErrorResponse(ERROR_METHOD_NOT_FOUND, "Method not found", data, id)
+    return ErrorResponse(ERROR_METHOD_NOT_FOUND, MSG_METHOD_NOT_FOUND, data, id)
 
 
 def ServerErrorResponse(data: Any, id: Any) -> ErrorResponse:
-    return ErrorResponse(ERROR_SERVER_ERROR, "Server error", data, id)
+    return ErrorResponse(ERROR_SERVER_ERROR, MSG_SERVER_ERROR, data, id)
 
 
 def serialize_error(response: ErrorResponse) -> Dict[str, Any]:
@@ -86,7 +90,7 @@ def serialize_success(response: SuccessResponse) -> Dict[str, Any]:
     return {"jsonrpc": "2.0", "result": response.result, "id": response.id}
 
 
-def to_serializable_one(response: ResponseType) -> Union[Deserialized, None]:
+def to_serializable_one(response: Response) -> Dict[str, Any]:
     return (
         serialize_error(response._error)
         if isinstance(response, Left)
@@ -94,7 +98,9 @@ def to_serializable_one(response: ResponseType) -> Union[Deserialized, None]:
     )
 
 
-def to_serializable(response: ResponseType) -> Union[Deserialized, None]:
+def to_serializable(
+    response: Union[Response, List[Response], None]
+) -> Union[Deserialized, None]:
     if response is None:
         return None
     elif isinstance(response, List):
@@ -8,9 +8,16 @@ The public functions are Success, Error and InvalidParams.
 """
 from typing import Any, NamedTuple
 
-from oslash.either import Either, Left, Right  # type: ignore
-
-from .codes import ERROR_INVALID_PARAMS, ERROR_METHOD_NOT_FOUND, ERROR_INTERNAL_ERROR
+from .either import Either, Left, Right
+
+from .codes import (
+    ERROR_INTERNAL_ERROR,
+    ERROR_INVALID_PARAMS,
+    ERROR_METHOD_NOT_FOUND,
+    MSG_INTERNAL_ERROR,
+    MSG_INVALID_PARAMS,
+    MSG_METHOD_NOT_FOUND,
+)
 from .sentinels import NODATA
 
 
@@ -38,15 +45,15 @@ Result = Either[ErrorResult, SuccessResult]
 
 
 def MethodNotFoundResult(data: Any) -> ErrorResult:
-    return ErrorResult(ERROR_METHOD_NOT_FOUND, "Method not found", data)
+    return ErrorResult(ERROR_METHOD_NOT_FOUND, MSG_METHOD_NOT_FOUND, data)
 
 
 def InternalErrorResult(data: Any) -> ErrorResult:
-    return ErrorResult(ERROR_INTERNAL_ERROR, "Internal error", data)
+    return ErrorResult(ERROR_INTERNAL_ERROR, MSG_INTERNAL_ERROR, data)
 
 
 def InvalidParamsResult(data: Any = NODATA) -> ErrorResult:
-    return ErrorResult(ERROR_INVALID_PARAMS, "Invalid params", data)
+    return ErrorResult(ERROR_INVALID_PARAMS, MSG_INVALID_PARAMS, data)
 
 
 # Helpers (the public functions)
@@ -6,9 +6,7 @@ from .main import dispatch
 
 class RequestHandler(BaseHTTPRequestHandler):
     def do_POST(self) -> None:
-        response = dispatch(
-            self.rfile.read(int(str(self.headers["Content-Length"]))).decode()
-        )
+        response = dispatch(self.rfile.read(int(str(self.headers["Content-Length"]))))
         if response is not None:
             self.send_response(200)
             self.send_header("Content-type", "application/json")
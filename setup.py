@@ -25,9 +25,11 @@ setup(
             "websockets",
             "werkzeug",
         ],
+        "msgspec": ["msgspec"],
+        "orjson": ["orjson"],
     },
     include_package_data=True,
-    install_requires=["jsonschema<5", "oslash<1"],
+    install_requires=["jsonschema<5"],
     license="MIT",
     long_description=README,
     long_description_content_type="text/markdown",
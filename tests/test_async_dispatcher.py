@@ -1,7 +1,8 @@
 from unittest.mock import patch
+import asyncio
 import pytest
 
-from oslash.either import Left, Right
+from jsonrpcserver.either import Left, Right
 
 from jsonrpcserver.async_dispatcher import (
     call,
@@ -12,6 +13,7 @@ from jsonrpcserver.async_dispatcher import (
 from jsonrpcserver.async_main import default_deserializer, default_validator
 from jsonrpcserver.codes import ERROR_INTERNAL_ERROR, ERROR_SERVER_ERROR
 from jsonrpcserver.exceptions import JsonRpcError
+from jsonrpcserver.methods import method
 from jsonrpcserver.request import Request
 from jsonrpcserver.response import ErrorResponse, SuccessResponse
 from jsonrpcserver.result import ErrorResult, Result, Success, SuccessResult
@@ -72,6 +74,77 @@ async def test_dispatch_deserialized():
     )
 
 
+@pytest.mark.asyncio
+async def test_dispatch_deserialized_batch_is_concurrent():
+    """Each method waits until every method in the batch has started, so this only
+    completes if the batch is dispatched concurrently."""
+    started = []
+    all_started = asyncio.Event()
+
+    async def wait() -> Result:
+        started.append(None)
+        if len(started) == 3:
+            all_started.set()
+        await all_started.wait()
+        return Success()
+
+    assert await asyncio.wait_for(
+        dispatch_deserialized(
+            {"wait": wait},
+            NOCONTEXT,
+            identity,
+            [{"jsonrpc": "2.0", "method": "wait", "id": i} for i in range(3)],
+        ),
+        timeout=1,
+    ) == [Right(SuccessResponse(None, i)) for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_deserialized_batch_memoize():
+    calls = []
+
+    @method(memoize=True)
+    async def double(x) -> Result:
+        calls.append(x)
+        return Success(x * 2)
+
+    assert await dispatch_deserialized(
+        {"double": double},
+        NOCONTEXT,
+        identity,
+        [
+            {"jsonrpc": "2.0", "method": "double", "params": [1], "id": 1},
+            {"jsonrpc": "2.0", "method": "double", "params": [1], "id": 2},
+            {"jsonrpc": "2.0", "method": "double", "params": [2], "id": 3},
+        ],
+    ) == [
+        Right(SuccessResponse(2, 1)),
+        Right(SuccessResponse(2, 2)),
+        Right(SuccessResponse(4, 3)),
+    ]
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_deserialized_batch_not_memoized():
+    calls = []
+
+    async def double(x) -> Result:
+        calls.append(x)
+        return Success(x * 2)
+
+    await dispatch_deserialized(
+        {"double": double},
+        NOCONTEXT,
+        identity,
+        [
+            {"jsonrpc": "2.0", "method": "double", "params": [1], "id": 1},
+            {"jsonrpc": "2.0", "method": "double", "params": [1], "id": 2},
+        ],
+    )
+    assert calls == [1, 1]
+
+
 @pytest.mark.asyncio
 async def test_dispatch_to_response_pure_success():
     assert (
@@ -1,6 +1,6 @@
 import pytest
 
-from oslash.either import Right
+from jsonrpcserver.either import Right
 
 from jsonrpcserver.async_main import (
     dispatch_to_response,
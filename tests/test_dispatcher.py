@@ -2,9 +2,10 @@
 from typing import Any
 from unittest.mock import patch, sentinel
 import json
+import threading
 import pytest
 
-from oslash.either import Left, Right
+from jsonrpcserver.either import Left, Right
 
 from jsonrpcserver.codes import (
     ERROR_INTERNAL_ERROR,
@@ -24,10 +25,13 @@ from jsonrpcserver.dispatcher import (
     extract_args,
     extract_kwargs,
     get_method,
+    get_signature,
     not_notification,
+    thread_pool,
     to_response,
     validate_args,
     validate_request,
+    workers_from_env,
 )
 from jsonrpcserver.exceptions import JsonRpcError
 from jsonrpcserver.main import (
@@ -181,6 +185,78 @@ def test_validate_result_object_method():
     assert validate_args(Request("f", ["one", "two"], NOID), NOCONTEXT, f) == Right(f)
 
 
+def test_validate_args_arity():
+    @method
+    def f(x):
+        pass
+
+    assert validate_args(Request("f", [1], NOID), NOCONTEXT, f) == Right(f)
+
+
+def test_validate_args_arity_too_many_positionals():
+    @method
+    def f(x):
+        pass
+
+    assert validate_args(Request("f", [1, 2], NOID), NOCONTEXT, f) == Left(
+        ErrorResult(
+            ERROR_INVALID_PARAMS, "Invalid params", "too many positional arguments"
+        )
+    )
+
+
+def test_validate_args_arity_subclass():
+    @method
+    class Base:
+        def __init__(self, x):
+            pass
+
+    class Child(Base):
+        def __init__(self):
+            pass
+
+    assert validate_args(Request("f", [5], NOID), NOCONTEXT, Child) == Left(
+        ErrorResult(
+            ERROR_INVALID_PARAMS, "Invalid params", "too many positional arguments"
+        )
+    )
+
+
+def test_validate_args_arity_bound_method():
+    class FooClass:
+        @method
+        def foo(self, x):
+            pass
+
+    f = FooClass().foo
+    assert validate_args(Request("f", [1, 2], NOID), NOCONTEXT, f) == Left(
+        ErrorResult(
+            ERROR_INVALID_PARAMS, "Invalid params", "too many positional arguments"
+        )
+    )
+
+
+# get_signature
+
+
+def test_get_signature():
+    def f(x):
+        pass
+
+    assert get_signature(f) is get_signature(f)
+    assert list(get_signature(f).parameters) == ["x"]
+
+
+def test_get_signature_unhashable():
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, x):
+            pass
+
+    assert list(get_signature(Unhashable()).parameters) == ["x"]
+
+
 # call
 
 
@@ -234,6 +310,14 @@ def test_get_method():
     )
 
 
+def test_get_method_missing():
+    class Fallback(dict):
+        def __missing__(self, key):
+            return ping
+
+    assert get_method(Fallback(), "non-existant") == Right(ping)
+
+
 # dispatch_request
 
 
@@ -292,6 +376,79 @@ def test_dispatch_deserialized():
     )
 
 
+def test_dispatch_deserialized_batch():
+    assert dispatch_deserialized(
+        methods={"ping": ping},
+        context=NOCONTEXT,
+        post_process=identity,
+        deserialized=[
+            {"jsonrpc": "2.0", "method": "ping", "id": 1},
+            {"jsonrpc": "2.0", "method": "ping"},
+            {"jsonrpc": "2.0", "method": "ping", "id": 2},
+        ],
+    ) == [Right(SuccessResponse("pong", 1)), Right(SuccessResponse("pong", 2))]
+
+
+@patch("jsonrpcserver.dispatcher.to_response")
+def test_dispatch_deserialized_batch_notifications(to_response):
+    calls = []
+
+    def notify() -> Result:
+        calls.append(None)
+        return Success()
+
+    assert (
+        dispatch_deserialized(
+            methods={"notify": notify},
+            context=NOCONTEXT,
+            post_process=identity,
+            deserialized=[
+                {"jsonrpc": "2.0", "method": "notify"},
+                {"jsonrpc": "2.0", "method": "notify"},
+            ],
+        )
+        is None
+    )
+    assert len(calls) == 2
+    to_response.assert_not_called()
+
+
+@patch("jsonrpcserver.dispatcher.WORKERS", 2)
+def test_dispatch_deserialized_batch_threads():
+    """Each method waits for the other one, which only works if they're dispatched on
+    separate threads."""
+    barrier = threading.Barrier(2, timeout=1)
+
+    def wait() -> Result:
+        barrier.wait()
+        return Success()
+
+    thread_pool.cache_clear()
+    try:
+        assert dispatch_deserialized(
+            methods={"wait": wait},
+            context=NOCONTEXT,
+            post_process=identity,
+            deserialized=[
+                {"jsonrpc": "2.0", "method": "wait", "id": 1},
+                {"jsonrpc": "2.0", "method": "wait", "id": 2},
+            ],
+        ) == [Right(SuccessResponse(None, 1)), Right(SuccessResponse(None, 2))]
+    finally:
+        thread_pool().shutdown()
+        thread_pool.cache_clear()
+
+
+@patch.dict("os.environ", {"JSONRPC_WORKERS": "4"})
+def test_workers_from_env():
+    assert workers_from_env() == 4
+
+
+@patch.dict("os.environ", {"JSONRPC_WORKERS": "abc"})
+def test_workers_from_env_invalid():
+    assert workers_from_env() == 0
+
+
 # validate_request
 
 
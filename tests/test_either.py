@@ -0,0 +1,18 @@
+from jsonrpcserver.either import Left, Right
+
+
+def test_left_bind():
+    assert Left("foo").bind(lambda x: Right(x + "bar")) == Left("foo")
+
+
+def test_right_bind():
+    assert Right("foo").bind(lambda x: Right(x + "bar")) == Right("foobar")
+
+
+def test_left_not_equal_to_right():
+    assert Left("foo") != Right("foo")
+
+
+def test_repr():
+    assert repr(Left("foo")) == "Left('foo')"
+    assert repr(Right("foo")) == "Right('foo')"
@@ -0,0 +1,107 @@
+import json
+import pytest
+
+pytest.importorskip("msgspec")
+
+from jsonrpcserver.codes import ERROR_INVALID_REQUEST, ERROR_PARSE_ERROR
+from jsonrpcserver.fast import fast_dispatch
+from jsonrpcserver.result import Error, Result, Success
+
+
+def ping() -> Result:
+    return Success("pong")
+
+
+def test_fast_dispatch():
+    assert json.loads(
+        fast_dispatch(b'{"jsonrpc": "2.0", "method": "ping", "id": 1}', {"ping": ping})
+    ) == {"jsonrpc": "2.0", "result": "pong", "id": 1}
+
+
+def test_fast_dispatch_str():
+    assert json.loads(
+        fast_dispatch('{"jsonrpc": "2.0", "method": "ping", "id": 1}', {"ping": ping})
+    ) == {"jsonrpc": "2.0", "result": "pong", "id": 1}
+
+
+def test_fast_dispatch_context():
+    def greet(context, name) -> Result:
+        return Success(f"{context} {name}")
+
+    assert json.loads(
+        fast_dispatch(
+            '{"jsonrpc": "2.0", "method": "greet", "params": ["Beau"], "id": 1}',
+            {"greet": greet},
+            context="Hello",
+        )
+    ) == {"jsonrpc": "2.0", "result": "Hello Beau", "id": 1}
+
+
+def test_fast_dispatch_notification():
+    assert fast_dispatch(b'{"jsonrpc": "2.0", "method": "ping"}', {"ping": ping}) == b""
+
+
+def test_fast_dispatch_null_id():
+    assert json.loads(
+        fast_dispatch(
+            b'{"jsonrpc": "2.0", "method": "ping", "id": null}', {"ping": ping}
+        )
+    ) == {"jsonrpc": "2.0", "result": "pong", "id": None}
+
+
+def test_fast_dispatch_batch():
+    assert (
+        json.loads(
+            fast_dispatch(
+                b"""[
+                {"jsonrpc": "2.0", "method": "ping", "id": 1},
+                {"jsonrpc": "2.0", "method": "ping"},
+                {"jsonrpc": "2.0", "method": "ping", "id": "2"}
+            ]""",
+                {"ping": ping},
+            )
+        )
+        == [
+            {"jsonrpc": "2.0", "result": "pong", "id": 1},
+            {"jsonrpc": "2.0", "result": "pong", "id": "2"},
+        ]
+    )
+
+
+def test_fast_dispatch_error():
+    def fail() -> Result:
+        return Error(1, "foo")
+
+    assert json.loads(
+        fast_dispatch(b'{"jsonrpc": "2.0", "method": "fail", "id": 1}', {"fail": fail})
+    ) == {"jsonrpc": "2.0", "error": {"code": 1, "message": "foo"}, "id": 1}
+
+
+def test_fast_dispatch_parse_error():
+    assert json.loads(fast_dispatch(b"{", {"ping": ping}))["error"]["code"] == (
+        ERROR_PARSE_ERROR
+    )
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        b"{}",
+        b"[]",
+        b'{"jsonrpc": "1.0", "method": "ping", "id": 1}',
+        b'{"jsonrpc": "2.0", "method": "ping", "id": true}',
+        b'{"jsonrpc": "2.0", "method": "ping", "params": "foo", "id": 1}',
+        b'{"jsonrpc": "2.0", "method": "ping", "foo": "bar", "id": 1}',
+        b'[{"jsonrpc": "2.0", "method": "ping", "id": 1}, {}]',
+    ],
+)
+def test_fast_dispatch_invalid_request(request_):
+    assert json.loads(fast_dispatch(request_, {"ping": ping})) == {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": ERROR_INVALID_REQUEST,
+            "message": "Invalid request",
+            "data": "The request failed schema validation",
+        },
+        "id": None,
+    }
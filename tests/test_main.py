@@ -1,9 +1,23 @@
-from oslash.either import Right
+from math import isnan
+import json
+import subprocess
+from unittest.mock import patch
+import sys
+import pytest
+
+from jsonrpcserver.codes import ERROR_PARSE_ERROR, ERROR_SERVER_ERROR
+from jsonrpcserver.either import Right
 
 from jsonrpcserver.main import (
     dispatch_to_response,
     dispatch_to_serializable,
+    default_validator,
     dispatch_to_json,
+    import_orjson,
+    is_valid_request,
+    orjson_deserializer,
+    orjson_serializer,
+    schema_validator,
 )
 from jsonrpcserver.response import SuccessResponse
 from jsonrpcserver.result import Result, Success
@@ -34,7 +48,214 @@ def test_dispatch_to_json():
     )
 
 
+def test_dispatch_to_json_nan():
+    assert (
+        dispatch_to_json(
+            '{"jsonrpc": "2.0", "method": "nan", "id": 1}',
+            {"nan": lambda: Success(float("nan"))},
+        )
+        == '{"jsonrpc": "2.0", "result": NaN, "id": 1}'
+    )
+
+
+def test_dispatch_to_json_bytes():
+    assert json.loads(
+        dispatch_to_json(
+            b'{"jsonrpc": "2.0", "method": "ping", "id": 1}', {"ping": ping}
+        )
+    ) == {"jsonrpc": "2.0", "result": "pong", "id": 1}
+
+
+def test_dispatch_to_json_bytes_parse_error():
+    assert json.loads(dispatch_to_json(b"\xff", {"ping": ping}))["error"]["code"] == (
+        ERROR_PARSE_ERROR
+    )
+
+
 def test_dispatch_to_json_notification():
     assert (
         dispatch_to_json('{"jsonrpc": "2.0", "method": "ping"}', {"ping": ping}) == ""
     )
+
+
+def test_dispatch_to_serializable_large_ints():
+    assert dispatch_to_serializable(
+        '{"jsonrpc": "2.0", "method": "echo", "params": [123456789012345678901234567890], "id": 18446744073709551617}',
+        {"echo": Success},
+    ) == {
+        "jsonrpc": "2.0",
+        "result": 123456789012345678901234567890,
+        "id": 18446744073709551617,
+    }
+
+
+def test_orjson_deserializer():
+    pytest.importorskip("orjson")
+    assert orjson_deserializer('{"jsonrpc": "2.0", "method": "ping", "id": 1}') == {
+        "jsonrpc": "2.0",
+        "method": "ping",
+        "id": 1,
+    }
+
+
+def test_orjson_deserializer_falls_back_to_json():
+    pytest.importorskip("orjson")
+    assert isnan(orjson_deserializer("NaN"))
+
+
+def test_orjson_deserializer_parse_error():
+    pytest.importorskip("orjson")
+    with pytest.raises(json.JSONDecodeError) as exc:
+        orjson_deserializer("{")
+    assert (
+        str(exc.value)
+        == "Expecting property name enclosed in double quotes: line 1 column 2 (char 1)"
+    )
+
+
+@pytest.fixture
+def no_orjson():
+    import_orjson.cache_clear()
+    with patch.dict(sys.modules, {"orjson": None}):
+        yield
+    import_orjson.cache_clear()
+
+
+def test_orjson_deserializer_not_installed(no_orjson):
+    response = dispatch_to_serializable(
+        '{"jsonrpc": "2.0", "method": "ping", "id": 1}',
+        {"ping": ping},
+        deserializer=orjson_deserializer,
+    )
+    assert response["error"]["code"] == ERROR_SERVER_ERROR
+    assert response["error"]["data"] == (
+        "orjson is not installed, install it with: pip install jsonrpcserver[orjson]"
+    )
+
+
+def test_orjson_serializer_not_installed(no_orjson):
+    with pytest.raises(ImportError) as exc:
+        dispatch_to_json(
+            '{"jsonrpc": "2.0", "method": "ping", "id": 1}',
+            {"ping": ping},
+            serializer=orjson_serializer,
+        )
+    assert str(exc.value) == (
+        "orjson is not installed, install it with: pip install jsonrpcserver[orjson]"
+    )
+
+
+def test_orjson_serializer():
+    pytest.importorskip("orjson")
+    assert (
+        orjson_serializer([{"jsonrpc": "2.0", "result": "pong", "id": 1}])
+        == '[{"jsonrpc":"2.0","result":"pong","id":1}]'
+    )
+
+
+def test_orjson_serializer_falls_back_to_json():
+    pytest.importorskip("orjson")
+    assert (
+        orjson_serializer({"jsonrpc": "2.0", "result": {1: "one"}, "id": 1})
+        == '{"jsonrpc": "2.0", "result": {"1": "one"}, "id": 1}'
+    )
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {"jsonrpc": "2.0", "method": "ping"},
+        {"jsonrpc": "2.0", "method": "ping", "id": 1},
+        {"jsonrpc": "2.0", "method": "ping", "id": "1"},
+        {"jsonrpc": "2.0", "method": "ping", "id": None},
+        {"jsonrpc": "2.0", "method": "ping", "params": [], "id": 1},
+        {"jsonrpc": "2.0", "method": "ping", "params": {}, "id": 1},
+    ],
+)
+def test_is_valid_request(request_):
+    assert is_valid_request(request_) is True
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {},
+        [],
+        "ping",
+        {"jsonrpc": "1.0", "method": "ping"},
+        {"jsonrpc": "2.0", "method": 1},
+        {"jsonrpc": "2.0", "method": "ping", "id": True},
+        {"jsonrpc": "2.0", "method": "ping", "params": "foo"},
+        {"jsonrpc": "2.0", "method": "ping", "foo": "bar"},
+    ],
+)
+def test_is_valid_request_invalid(request_):
+    assert is_valid_request(request_) is False
+
+
+def test_default_validator():
+    request = {"jsonrpc": "2.0", "method": "ping", "id": 1}
+    assert default_validator(request) == request
+
+
+def test_default_validator_batch():
+    request = [
+        {"jsonrpc": "2.0", "method": "ping", "id": 1},
+        {"jsonrpc": "2.0", "method": "ping"},
+    ]
+    assert default_validator(request) == request
+
+
+def test_default_validator_batch_invalid():
+    with pytest.raises(Exception):
+        default_validator([{"jsonrpc": "2.0", "method": "ping"}, {}])
+
+
+def test_default_validator_empty_batch():
+    with pytest.raises(Exception):
+        default_validator([])
+
+
+def test_schema_validator_is_cached():
+    assert schema_validator(False) is schema_validator(False)
+    assert schema_validator(True) is not schema_validator(False)
+
+
+def test_schema_validator_single():
+    schema_validator(False)({"jsonrpc": "2.0", "method": "ping", "id": 1})
+    with pytest.raises(Exception):
+        schema_validator(False)([{"jsonrpc": "2.0", "method": "ping", "id": 1}])
+
+
+def test_schema_validator_batch():
+    schema_validator(True)([{"jsonrpc": "2.0", "method": "ping", "id": 1}])
+    with pytest.raises(Exception):
+        schema_validator(True)([])
+
+
+def test_default_validator_invalid():
+    with pytest.raises(Exception):
+        default_validator({"jsonrpc": "2.0", "method": "ping", "id": True})
+
+
+def test_import_is_lazy():
+    """Importing the package shouldn't import jsonschema, asyncio or orjson; they're
+    only needed when a request fails the quick check, for async dispatch, or when
+    orjson is opted into."""
+    modules = ["jsonschema", "asyncio", "orjson"]
+    code = f"import jsonrpcserver, sys; print([m for m in {modules} if m in sys.modules])"
+    assert subprocess.check_output([sys.executable, "-c", code]).strip() == b"[]"
+
+
+def test_lazy_attribute():
+    import jsonrpcserver
+    from jsonrpcserver.async_main import dispatch
+
+    assert jsonrpcserver.async_dispatch is dispatch
+
+
+def test_lazy_attribute_missing():
+    import jsonrpcserver
+
+    with pytest.raises(AttributeError):
+        jsonrpcserver.foo
@@ -1,4 +1,11 @@
-from jsonrpcserver.methods import global_methods, method
+from functools import wraps
+
+from jsonrpcserver.methods import (
+    global_methods,
+    method,
+    method_attribute,
+    positional_arity,
+)
 
 
 def test_decorator():
@@ -15,3 +22,83 @@ def test_decorator_custom_name():
         pass
 
     assert callable(global_methods["baz"])
+
+
+def test_decorator_arity():
+    @method
+    def foo(x, y=1):
+        pass
+
+    assert foo.__jsonrpc_arity__ == (1, 2)
+
+
+def test_decorator_memoize():
+    @method(memoize=True)
+    async def foo():
+        pass
+
+    assert foo.__jsonrpc_memoize__ is True
+
+
+def test_method_attribute():
+    @method(memoize=True)
+    async def foo():
+        pass
+
+    assert method_attribute(foo, "__jsonrpc_memoize__") is True
+
+
+def test_method_attribute_not_decorated():
+    assert method_attribute(lambda: None, "__jsonrpc_memoize__") is None
+
+
+def test_method_attribute_subclass():
+    @method(memoize=True)
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    assert method_attribute(Child, "__jsonrpc_memoize__") is None
+
+
+def test_method_attribute_bound_method():
+    class Foo:
+        @method(memoize=True)
+        async def foo(self):
+            pass
+
+    assert method_attribute(Foo().foo, "__jsonrpc_memoize__") is None
+
+
+def test_method_attribute_wrapper():
+    @method(memoize=True)
+    async def foo():
+        pass
+
+    @wraps(foo)
+    async def wrapper():
+        return await foo()
+
+    assert method_attribute(wrapper, "__jsonrpc_memoize__") is None
+
+
+def test_positional_arity_no_params():
+    assert positional_arity(lambda: None) == (0, 0)
+
+
+def test_positional_arity_var_positional():
+    assert positional_arity(lambda x, *args: None) == (1, None)
+
+
+def test_positional_arity_optional_keyword_only():
+    assert positional_arity(lambda x, *, y=1: None) == (1, 1)
+
+
+def test_positional_arity_required_keyword_only():
+    assert positional_arity(lambda x, *, y: None) is None
+
+
+def test_positional_arity_uninspectable():
+    assert positional_arity(dict) is None
@@ -1,6 +1,6 @@
 from unittest.mock import sentinel
 
-from oslash.either import Left, Right
+from jsonrpcserver.either import Left, Right
 
 from jsonrpcserver.result import (
     Error,